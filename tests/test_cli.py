@@ -1,6 +1,8 @@
 import subprocess
 import sys
+from importlib.resources import files
 
+import pytest
 from pendulum.parsing import ParserError
 from typer.testing import CliRunner
 
@@ -20,6 +22,20 @@ def test_help_via_main() -> None:
     assert result.returncode == 0
 
 
+def test_baked_help_matches_rendered_help(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Render under the same pinned environment and normalization as tools/bake_help.py,
+    # so this fails whenever a help-string change isn't re-baked into _help.txt.
+    monkeypatch.setenv("COLUMNS", "80")
+    monkeypatch.setenv("TERM", "dumb")
+
+    result = runner.invoke(app, ["--help"])
+
+    rendered = "\n".join(line.rstrip() for line in result.stdout.splitlines()).rstrip("\n") + "\n"
+    assert files(PACKAGE_NAME).joinpath("_help.txt").read_text() == rendered
+
+
 def test_version(runner: CliRunner) -> None:
     result = runner.invoke(app, ["--version"])
 
@@ -27,6 +43,23 @@ def test_version(runner: CliRunner) -> None:
     assert result.exit_code == 0
 
 
+@pytest.mark.parametrize("option", ["--version", "-V"])
+def test_version_via_main(option: str) -> None:
+    result = subprocess.run(
+        [sys.executable, "-m", PACKAGE_NAME, option], capture_output=True, text=True
+    )
+
+    assert result.returncode == 0
+    assert __version__ in result.stdout
+
+
+def test_bare_invocation_via_main_shows_help() -> None:
+    result = subprocess.run([sys.executable, "-m", PACKAGE_NAME], capture_output=True, text=True)
+
+    assert result.returncode == 0
+    assert "Usage" in result.stdout
+
+
 def test_parse_error(runner: CliRunner) -> None:
     result = runner.invoke(app, ["not a time"])
 
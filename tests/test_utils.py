@@ -0,0 +1,14 @@
+from typing import List
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from when.utils import partition
+
+
+@given(st.lists(st.integers()))
+def test_partition_splits_by_predicate(items: List[int]) -> None:
+    evens, odds = partition(items, lambda x: x % 2 == 0)
+
+    assert evens == [x for x in items if x % 2 == 0]
+    assert odds == [x for x in items if x % 2 != 0]
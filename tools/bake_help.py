@@ -0,0 +1,27 @@
+"""Regenerate when/_help.txt, the pre-rendered help used by the bare-invocation fast path."""
+
+import os
+from pathlib import Path
+
+# Pin the rendering environment so the baked output is deterministic.
+os.environ["COLUMNS"] = "80"
+os.environ["TERM"] = "dumb"
+
+from typer.testing import CliRunner
+
+from when.main import app
+
+HELP_FILE = Path(__file__).resolve().parent.parent / "when" / "_help.txt"
+
+
+def main() -> None:
+    result = CliRunner().invoke(app, ["--help"])
+    # Normalize to match the repo's pre-commit hooks (trailing-whitespace,
+    # end-of-file-fixer) so they never rewrite the baked file.
+    lines = [line.rstrip() for line in result.stdout.splitlines()]
+    HELP_FILE.write_text("\n".join(lines).rstrip("\n") + "\n")
+    print(f"Wrote {HELP_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,26 @@
-from when.constants import PACKAGE_NAME
-from when.main import app
+import sys
 
-app(prog_name=PACKAGE_NAME)
+from when.constants import PACKAGE_NAME, __version__
+
+
+def main() -> None:
+    # Answer a bare version query before paying for the Typer/Click import.
+    if len(sys.argv) == 2 and sys.argv[1] in ("--version", "-V"):
+        print(f"{PACKAGE_NAME} {__version__}")
+        sys.exit(0)
+
+    # A bare invocation just shows help; serve the pre-rendered copy baked by
+    # tools/bake_help.py instead of building the whole Typer command tree.
+    if len(sys.argv) == 1:
+        from importlib.resources import files
+
+        sys.stdout.write(files(PACKAGE_NAME).joinpath("_help.txt").read_text())
+        sys.exit(0)
+
+    from when.main import app
+
+    app(prog_name=PACKAGE_NAME)
+
+
+if __name__ == "__main__":
+    main()
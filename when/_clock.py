@@ -0,0 +1,188 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from math import cos, pi, sin
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pendulum
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.segment import Segment
+from rich.style import Style
+
+TAU = 2 * pi
+
+# Sparse map of (row, column) -> (character, style) for the cells that aren't blank.
+Marks = Dict[Tuple[int, int], Tuple[str, Style]]
+
+WHITE = Style(color="white")
+WHITE_BOLD = Style(color="white", bold=True)
+
+HOUR_STYLE = Style(color="#7570b3")
+MINUTE_STYLE = Style(color="#d95f02")
+SECOND_STYLE = Style(color="#1b9e77")
+
+# How many positions each hand can occupy around the face.
+HOUR_SLOTS = 12 * 60  # quantized to the minute
+MINUTE_SLOTS = 60 * 60  # sweeps with the second
+SECOND_SLOTS = 60
+
+
+@dataclass(frozen=True)
+class Clock:
+    target: Optional[pendulum.DateTime] = None
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        global _last_frame
+
+        # Without an explicit target, read the current time at render time so the
+        # surrounding Live display can simply re-render the same Clock instance.
+        target = self.target if self.target is not None else pendulum.now()
+        hour, minute, second = target.hour, target.minute, target.second
+
+        # The hands only move once per second, so most 10Hz refreshes can replay
+        # the previous frame's segments.
+        key = (options.max_width, options.max_height, hour, minute, second)
+        if _last_frame is not None and _last_frame[0] == key:
+            yield from _last_frame[1]
+            return
+
+        size = options.max_height - 2
+        width = size * 2
+
+        center = size // 2
+        radius = center
+
+        # The face never changes for a given size, so only the hands are drawn per frame.
+        marks = dict(face_marks(size))
+
+        draw_hand(
+            marks,
+            center,
+            hand_xy(radius, center, HOUR_SLOTS)[(hour % 12) * 60 + minute],
+            HOUR_STYLE,
+            "H",
+        )
+        draw_hand(
+            marks,
+            center,
+            hand_xy(radius, center, MINUTE_SLOTS)[minute * 60 + second],
+            MINUTE_STYLE,
+            "M",
+        )
+        draw_hand(
+            marks,
+            center,
+            hand_xy(radius, center, SECOND_SLOTS)[second],
+            SECOND_STYLE,
+            "S",
+        )
+
+        # Emit Segments directly rather than assembling a Text block: the grid is
+        # already a rectangle of monospaced cells, so centering is plain padding.
+        top_pad = max((options.max_height - size) // 2, 0)
+        left_pad = max((options.max_width - width) // 2, 0)
+
+        frame: List[Segment] = [Segment.line()] * top_pad
+        padding = Segment(" " * left_pad)
+        for row in grid_segments(marks, size, width):
+            frame.append(padding)
+            frame.extend(row)
+            frame.append(Segment.line())
+
+        _last_frame = (key, frame)
+        yield from frame
+
+
+_last_frame: Optional[Tuple[Tuple[int, int, int, int, int], List[Segment]]] = None
+
+
+@lru_cache(maxsize=8)
+def face_marks(size: int) -> Marks:
+    center = size // 2
+    radius = center
+
+    marks: Marks = {(center, center * 2): ("✵", WHITE_BOLD)}
+
+    tick_xy = hand_xy(radius, center, SECOND_SLOTS)
+    for sixtieth in range(1, 61):
+        x, y = tick_xy[sixtieth % 60]
+
+        if sixtieth % 5 == 0:
+            for offset, c in enumerate(str(sixtieth // 5)):
+                marks[(y, x * 2 + offset)] = (c, WHITE)
+        else:
+            marks[(y, x * 2)] = (".", WHITE)
+
+    return marks
+
+
+def grid_segments(marks: Marks, height: int, width: int) -> Iterator[List[Segment]]:
+    columns_by_row: List[List[int]] = [[] for _ in range(height)]
+    for y, x in marks:
+        columns_by_row[y].append(x)
+
+    for y in range(height):
+        segments: List[Segment] = []
+        cursor = 0
+        run_chars: List[str] = []
+        run_style: Optional[Style] = None
+        for x in sorted(columns_by_row[y]):
+            char, style = marks[(y, x)]
+            if x == cursor and style is run_style:
+                run_chars.append(char)
+            else:
+                if run_chars:
+                    segments.append(Segment("".join(run_chars), run_style))
+                if x > cursor:
+                    segments.append(Segment(" " * (x - cursor)))
+                run_chars = [char]
+                run_style = style
+            cursor = x + 1
+        if run_chars:
+            segments.append(Segment("".join(run_chars), run_style))
+        if cursor < width:
+            segments.append(Segment(" " * (width - cursor)))
+
+        yield segments
+
+
+def fraction_to_clock_angle(frac: float) -> float:
+    return (frac * TAU) - TAU / 4
+
+
+@lru_cache(maxsize=None)
+def hand_xy(radius: int, center: int, slots: int) -> Tuple[Tuple[int, int], ...]:
+    return tuple(
+        (
+            round(cos(theta) * radius) + center,
+            round(sin(theta) * radius) + center,
+        )
+        for theta in (fraction_to_clock_angle(slot / slots) for slot in range(slots))
+    )
+
+
+def draw_hand(
+    marks: Marks, center: int, end: Tuple[int, int], style: Style, last: str
+) -> None:
+    end_x, end_y = end
+
+    # Integer-only Bresenham from the center to the endpoint.
+    x, y = center, center
+    dx = abs(end_x - x)
+    dy = -abs(end_y - y)
+    sx = 1 if x < end_x else -1
+    sy = 1 if y < end_y else -1
+    err = dx + dy
+    dot = (".", style)
+
+    while (x, y) != (end_x, end_y):
+        if (x, y) != (center, center):
+            marks[(y, x * 2)] = dot
+        doubled_err = 2 * err
+        if doubled_err >= dy:
+            err += dy
+            x += sx
+        if doubled_err <= dx:
+            err += dx
+            y += sy
+
+    marks[(end_y, end_x * 2)] = (last, Style.chain(style, Style(bold=True)))
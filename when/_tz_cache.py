@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple
+from zoneinfo import ZoneInfo
+
+
+@lru_cache(maxsize=4096)
+def _tz(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+@lru_cache(maxsize=None)
+def _local_tz() -> ZoneInfo:
+    import pendulum
+
+    return ZoneInfo(pendulum.local_timezone().name)
+
+
+@lru_cache(maxsize=None)
+def _available_timezones() -> FrozenSet[str]:
+    from pytzdata import get_timezones
+
+    return frozenset(get_timezones())
+
+
+@lru_cache(maxsize=None)
+def _timezones_by_region() -> Dict[str, Tuple[str, ...]]:
+    by_region: Dict[str, List[str]] = {}
+    for name in _available_timezones():
+        by_region.setdefault(name.split("/", 1)[0].lower(), []).append(name)
+    return {region: tuple(names) for region, names in by_region.items()}
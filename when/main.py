@@ -1,35 +1,25 @@
+from __future__ import annotations
+
 import re
 from dataclasses import dataclass
-from difflib import get_close_matches
-from math import cos, pi, sin
-from textwrap import dedent
+from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from time import sleep
-from typing import Iterable, List, Optional, Sequence, Set, Tuple
-
-import pendulum
-import pendulum.tz.timezone
-from humanize import precisedelta
-from more_itertools import partition
-from pendulum import UTC
-from pendulum.parsing import ParserError
-from pytzdata import get_timezones
-from rich.align import Align
-from rich.box import ROUNDED
-from rich.console import Console, ConsoleOptions, ConsoleRenderable, RenderableType, RenderResult
-from rich.live import Live
-from rich.style import Style
-from rich.table import Column, Table
-from rich.text import Text
+from typing import TYPE_CHECKING, FrozenSet, Iterable, List, Optional, Pattern
+
 from typer import Argument, Exit, Option, Typer
 
 from when.constants import PACKAGE_NAME, __version__
 
+if TYPE_CHECKING:
+    from zoneinfo import ZoneInfo
+
+    import pendulum
+    from rich.console import Console, ConsoleRenderable
+
 app = Typer(
-    help=dedent(
-        f"""\
-        Display detailed information about a time.
-        """
-    ),
+    help="Display detailed information about a time.",
     no_args_is_help=True,
 )
 
@@ -40,96 +30,104 @@ def version_callback(value: bool) -> None:
         raise Exit()
 
 
+@lru_cache(maxsize=None)
+def _stdout() -> Console:
+    from rich.console import Console
+
+    return Console()
+
+
+@lru_cache(maxsize=None)
+def _stderr() -> Console:
+    from rich.console import Console
+
+    return Console(stderr=True)
+
+
 @app.command()
 def when(
     t: str = Argument(
         None,
         metavar="TARGET",
-        help=dedent(
-            """\
-            The time to display information about.
-            """
-        ),
+        help="The time to display information about.",
     ),
     timezones: List[str] = Option(
         [],
         "--timezone",
         "-z",
-        help=dedent(
-            """\
-            Add a timezone to convert to.
-            Pass this option multiple times to add multiple timezones.
-            """
-        ),
+        help="Add a timezone to convert to. Pass this option multiple times to add multiple timezones.",
     ),
     add_utc: bool = Option(
         True,
-        help=dedent(
-            """\
-            Whether to implicitly include UTC in the output.
-            """
-        ),
+        help="Whether to implicitly include UTC in the output.",
     ),
     add_local: bool = Option(
         True,
-        help=dedent(
-            """\
-            Whether to implicitly include the local timezone in the output.
-            """
-        ),
+        help="Whether to implicitly include the local timezone in the output.",
     ),
     clock: bool = Option(
         False,
-        help=dedent(
-            """\
-            Display an animated clock showing current local time instead of the normal output.
-            """
-        ),
+        help="Display an animated clock showing current local time instead of the normal output.",
     ),
     version: Optional[bool] = Option(
         None,
         "--version",
+        "-V",
         callback=version_callback,
-        help=dedent(
-            """\
-            Display version information, then exit.
-            """
-        ),
+        help="Display version information, then exit.",
     ),
 ) -> None:
-    stdout = Console()
-    stderr = Console(stderr=True)
+    import pendulum
+    from pendulum.parsing import ParserError
+    from rich.text import Text
+
+    from when._tz_cache import _available_timezones, _local_tz, _tz
+    from when.utils import partition
+
+    stdout = _stdout()
 
     now = pendulum.now()
 
     if clock:
+        from rich.live import Live
+
+        from when._clock import Clock
+
+        # The Clock reads the current time each render, so Live's refresh thread
+        # does all the work; the main thread just parks.
         with Live(
-            renderable=Clock(target=pendulum.now()), console=stdout, auto_refresh=True, screen=True
-        ) as live:
+            renderable=Clock(),
+            console=stdout,
+            auto_refresh=True,
+            refresh_per_second=10,
+            screen=True,
+        ):
             while True:
-                live.update(Clock(target=pendulum.now()))
-                sleep(0.1)
+                sleep(3600)
     else:
         try:
             target = parse_t(t) or now
         except ParserError as e:
-            stderr.print(Text(str(e), style="red"))
+            _stderr().print(Text(str(e), style="red"))
             raise Exit(1)
 
-        available_timezones = set(get_timezones())
-        bad_timezones, good_timezones = partition(lambda tz: tz in available_timezones, timezones)
+        available_timezones = _available_timezones()
+        good_timezones, bad_timezones = partition(timezones, lambda tz: tz in available_timezones)
         display_bad_timezone_help(stdout, available_timezones, bad_timezones)
 
-        display_timezones = {pendulum.timezone(tz) for tz in good_timezones}  # type: ignore
+        display_timezones = {_tz(tz) for tz in good_timezones}
         if add_utc:
-            display_timezones.add(UTC)
+            display_timezones.add(_tz("UTC"))
         if add_local:
-            display_timezones.add(pendulum.local_timezone())  # type: ignore
+            display_timezones.add(_local_tz())
+
+        decorated = [(tz.utcoffset(now), tz) for tz in display_timezones]
+        decorated.sort(key=itemgetter(0), reverse=True)
 
         rich_time = RichTime(
             target=target,
             now=now,
-            timezones=sorted(display_timezones, key=lambda tz: tz.utcoffset(now), reverse=True),
+            timezones=[tz for _, tz in decorated],
         )
 
         stdout.print(rich_time)
@@ -137,13 +135,15 @@ def when(
 
 def display_bad_timezone_help(
     console: Console,
-    available_timezones: Set[str],
+    available_timezones: FrozenSet[str],
     bad_timezones: Iterable[str],
 ) -> None:
+    from rich.text import Text
+
     msg = Text(style="red")
     for tz in bad_timezones:
         msg.append(f"Unknown timezone ").append(tz, style="bold").append(".")
-        nearby_timezones = get_close_matches(tz, available_timezones)
+        nearby_timezones = close_timezone_matches(tz, available_timezones)
         if nearby_timezones:
             msg.append(" Maybe you meant:")
             for match in nearby_timezones:
@@ -154,55 +154,103 @@ def display_bad_timezone_help(
     console.print(msg, end="")
 
 
-EPOCH_SECONDS = re.compile(r"\d{1,10}(\.\d+)?")
-EPOCH_MILLISECONDS = re.compile(r"\d{13}")
-EPOCH_MICROSECONDS = re.compile(r"\d{16}")
+def close_timezone_matches(tz: str, available_timezones: FrozenSet[str]) -> List[str]:
+    from difflib import get_close_matches
+
+    from when._tz_cache import _timezones_by_region
+
+    # SequenceMatcher over all ~600 zone names is quadratic in string length;
+    # pre-filter to the same region (the part before the /) plus substring hits.
+    candidates = set(_timezones_by_region().get(tz.split("/", 1)[0].lower(), ()))
+    lowered = tz.lower()
+    candidates.update(name for name in available_timezones if lowered in name.lower())
+
+    return get_close_matches(tz, candidates or available_timezones)
+
+
+_EPOCH_SECONDS: Optional[Pattern[str]] = None
+
+MILLISECONDS_PER_SECOND = 1e3
+MICROSECONDS_PER_SECOND = 1e6
 
 
 def parse_t(t: Optional[str]) -> Optional[pendulum.DateTime]:
+    global _EPOCH_SECONDS
+
     if not t:
         return None
-    elif EPOCH_SECONDS.fullmatch(t):
-        return pendulum.from_timestamp(float(t))
-    elif EPOCH_MILLISECONDS.fullmatch(t):
-        return pendulum.from_timestamp(float(t) / 1e3)
-    elif EPOCH_MICROSECONDS.fullmatch(t):
-        return pendulum.from_timestamp(float(t) / 1e6)
-    else:
-        parsed = pendulum.parse(t)
-        if not isinstance(parsed, pendulum.DateTime):
-            raise Exception("nope")
-        return parsed
+
+    import pendulum
+
+    from_timestamp = pendulum.from_timestamp
+
+    # Classify epoch timestamps by length instead of running a regex per bucket.
+    # isdecimal, not isdigit: superscripts and circled digits pass isdigit but
+    # blow up float(); decimal characters are exactly what \d and float() accept.
+    if t.isdecimal():
+        digits = len(t)
+        if digits <= 10:
+            return from_timestamp(float(t))  # epoch seconds
+        elif digits == 13:
+            return from_timestamp(float(t) / MILLISECONDS_PER_SECOND)  # epoch milliseconds
+        elif digits == 16:
+            return from_timestamp(float(t) / MICROSECONDS_PER_SECOND)  # epoch microseconds
+    elif t[0].isdecimal() and "." in t:
+        if _EPOCH_SECONDS is None:
+            _EPOCH_SECONDS = re.compile(r"\A\d{1,10}\.\d+\Z")
+        if _EPOCH_SECONDS.match(t):
+            return from_timestamp(float(t))  # epoch seconds with fraction
+
+    parsed = pendulum.parse(t)
+    if not isinstance(parsed, pendulum.DateTime):
+        raise Exception("nope")
+    return parsed
 
 
 @dataclass(frozen=True)
 class RichTime:
     target: pendulum.DateTime
     now: pendulum.DateTime
-    timezones: List[pendulum.tz._Timezone]
+    timezones: List[ZoneInfo]
 
     def __rich__(self) -> ConsoleRenderable:
+        from humanize import precisedelta
+        from rich.box import ROUNDED
+        from rich.table import Column, Table
+
+        target = self.target
+        now = self.now
+
         metadata = Table(box=ROUNDED, show_header=False)
-        diff = self.now.diff(self.target, abs=False)
-        if self.target != self.now:
+        if target != now:
+            total_seconds = now.diff(target, abs=False).total_seconds()
             metadata.add_row(
                 "Relative to Now",
-                f"{precisedelta(int(diff.total_seconds()))} {'ago' if diff.total_seconds() < 0 else 'from now'}",
+                f"{precisedelta(int(total_seconds))} {'ago' if total_seconds < 0 else 'from now'}",
             )
-        metadata.add_row("Epoch Timestamp (s)", f"{self.target.timestamp()}")
-        metadata.add_row("Epoch Timestamp (ms)", f"{int(self.target.timestamp() * 1e3)}")
-        metadata.add_row("Epoch Timestamp (µs)", f"{int(self.target.timestamp() * 1e6)}")
+
+        # Integer math on pendulum's internal seconds/microseconds avoids the
+        # float round-trip, which loses precision at the microsecond scale.
+        total_microseconds = target.int_timestamp * 1_000_000 + target.microsecond
+        sign = "-" if total_microseconds < 0 else ""
+        seconds, microseconds = divmod(abs(total_microseconds), 1_000_000)
+        metadata.add_row("Epoch Timestamp (s)", f"{sign}{seconds}.{microseconds:06d}")
+        metadata.add_row("Epoch Timestamp (ms)", f"{total_microseconds // 1_000}")
+        metadata.add_row("Epoch Timestamp (µs)", f"{total_microseconds}")
 
         columns = [
             Column("Timezone"),
             Column("Target"),
         ]
+        # Convert through a stdlib datetime once; stdlib astimezone is far cheaper
+        # than pendulum's per row, and tz objects are plain tzinfo instances.
+        target_datetime = datetime.fromtimestamp(target.int_timestamp, tz=timezone.utc)
         rows = [
             (
-                timezone.name,
-                str(self.target.astimezone(timezone).to_datetime_string()),
+                tz.key,
+                target_datetime.astimezone(tz).strftime("%Y-%m-%d %H:%M:%S"),
             )
-            for timezone in self.timezones
+            for tz in self.timezones
         ]
 
         by_timezone = Table(*columns, box=ROUNDED)
@@ -213,101 +261,3 @@ class RichTime:
         wrapper.add_row(by_timezone, metadata)
 
         return wrapper
-
-
-TAU = 2 * pi
-
-
-@dataclass(frozen=True)
-class Clock:
-    target: pendulum.DateTime
-
-    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
-        size = options.max_height - 2
-        clock = [[Text(" ") for _ in range(size * 2)] + [Text("\n")] for _ in range(size)]
-
-        center = size // 2
-        radius = center
-
-        clock[center][center * 2] = Text("✵", style=Style(color="white", bold=True))
-
-        for sixtieth in range(1, 61):
-            theta = fraction_to_clock_angle(sixtieth / 60)
-            x = round(cos(theta) * radius) + center
-            y = round(sin(theta) * radius) + center
-
-            if sixtieth % 5 == 0:
-                texts = [Text(c, style=Style(color="white")) for c in str(sixtieth // 5)]
-                clock[y][x * 2 : x * 2 + len(texts)] = texts
-            else:
-                clock[y][x * 2] = Text(".", style=Style(color="white"))
-
-        draw_hand(
-            clock,
-            center,
-            radius,
-            fraction_to_clock_angle(
-                (self.target.hour + self.target.minute / 60 + self.target.second / 3600) % 12 / 12
-            ),
-            Style(color="#7570b3"),
-            "H",
-        )
-        draw_hand(
-            clock,
-            center,
-            radius,
-            fraction_to_clock_angle((self.target.minute + self.target.second / 60) / 60),
-            Style(color="#d95f02"),
-            "M",
-        )
-        draw_hand(
-            clock,
-            center,
-            radius,
-            fraction_to_clock_angle(self.target.second / 60),
-            Style(color="#1b9e77"),
-            "S",
-        )
-
-        yield Align.center(
-            Text.assemble(*(row for row in (Text.assemble(*x) for x in clock))),
-            vertical="middle",
-        )
-
-
-def fraction_to_clock_angle(frac: float) -> float:
-    return (frac * TAU) - TAU / 4
-
-
-def draw_hand(
-    clock: List[List[Text]], center: int, radius: int, theta: float, style: Style, last: str
-) -> None:
-    second_x = round(cos(theta) * radius) + center
-    second_y = round(sin(theta) * radius) + center
-    dx = abs(center - second_x)
-    dy = abs(center - second_y)
-
-    if dx > dy:
-        start, stop = sorted((center, second_x))
-        slope = (second_y - center) / (second_x - center)
-        for x in range(start, stop):
-            y = round(slope * (x - center)) + center
-            if (x, y) == (center, center):
-                continue
-            clock[y][x * 2] = Text(".", style=style)
-    else:
-        start, stop = sorted((center, second_y))
-        if second_x != center:
-            slope = (second_y - center) / (second_x - center)
-            for y in range(start, stop):
-                x = round((y - center) / slope) + center
-                if (x, y) == (center, center):
-                    continue
-                clock[y][x * 2] = Text(".", style=style)
-        else:
-            for y in range(start, stop):
-                if (center, y) == (center, center):
-                    continue
-                clock[y][center * 2] = Text(".", style=style)
-
-    clock[second_y][second_x * 2] = Text(last, style=Style.chain(style, Style(bold=True)))
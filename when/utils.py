@@ -0,0 +1,15 @@
+from typing import Callable, Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def partition(items: Iterable[T], predicate: Callable[[T], bool]) -> Tuple[List[T], List[T]]:
+    matching: List[T] = []
+    non_matching: List[T] = []
+    append_matching = matching.append
+    append_non_matching = non_matching.append
+
+    for item in items:
+        (append_matching if predicate(item) else append_non_matching)(item)
+
+    return matching, non_matching